@@ -42,9 +42,6 @@ async def health_check():
     """서비스 상태 확인"""
     try:
         # 각 컴포넌트 상태 확인
-        pg_manager = PostgreSQLManager()
-        qdrant_manager = QdrantManager()
-        
         status = {
             "status": "healthy",
             "timestamp": time.time(),
@@ -56,9 +53,12 @@ async def health_check():
         
         # PostgreSQL 연결 확인
         try:
-            async with pg_manager.get_connection() as conn:
-                await conn.execute("SELECT 1")
-                status["components"]["postgresql"] = "healthy"
+            async with postgres_manager.get_connection() as conn:
+                if await postgres_manager.health_check(conn):
+                    status["components"]["postgresql"] = "healthy"
+                else:
+                    status["components"]["postgresql"] = "unhealthy: SELECT 1 실패"
+                    status["status"] = "degraded"
         except Exception as e:
             status["components"]["postgresql"] = f"unhealthy: {str(e)}"
             status["status"] = "degraded"
@@ -123,11 +123,8 @@ async def get_metrics_status():
 async def get_sync_status():
     """동기화 상태 확인"""
     try:
-        pg_manager = PostgreSQLManager()
-        qdrant_manager = QdrantManager()
-        
         # PostgreSQL에서 총 매물 수 확인
-        async with pg_manager.get_connection() as conn:
+        async with postgres_manager.get_connection() as conn:
             pg_count_result = await conn.fetchrow(
                 "SELECT COUNT(*) as total FROM products"
             )
@@ -183,8 +180,6 @@ async def vector_search(query: Dict[str, Any]):
 async def reset_qdrant_collection():
     """🗑️ Qdrant bike 컬렉션 완전 삭제 및 재생성"""
     try:
-        qdrant_manager = QdrantManager()
-        
         # 컬렉션 존재 확인
         collections = await qdrant_manager.list_collections()
         collection_name = config.QDRANT_COLLECTION
@@ -212,9 +207,7 @@ async def reset_qdrant_collection():
 async def reset_postgresql_flags():
     """🔄 PostgreSQL product 테이블의 is_conversion, vector_id 리셋"""
     try:
-        pg_manager = PostgreSQLManager()
-        
-        async with pg_manager.get_connection() as conn:
+        async with postgres_manager.get_connection() as conn:
             # is_conversion을 false로, vector_id를 null로 리셋
             result = await conn.execute(
                 "UPDATE product SET is_conversion = false, vector_id = null"
@@ -246,12 +239,10 @@ async def reset_postgresql_flags():
 async def process_single_product(uid: str):
     """🔧 단일 제품 벡터화 처리 (테스트용)"""
     try:
-        pg_manager = PostgreSQLManager()
-        qdrant_manager = QdrantManager()
         embedding_service = EmbeddingService()
         
         # 1. PostgreSQL에서 제품 정보 조회
-        async with pg_manager.get_connection() as conn:
+        async with postgres_manager.get_connection() as conn:
             # uid가 숫자인지 확인 후 적절한 타입으로 변환
             try:
                 if uid.isdigit():
@@ -296,7 +287,7 @@ async def process_single_product(uid: str):
         }])
         
         # 5. PostgreSQL 업데이트
-        async with pg_manager.get_connection() as conn:
+        async with postgres_manager.get_connection() as conn:
             await conn.execute(
                 "UPDATE product SET vector_id = $1, is_conversion = true WHERE uid = $2",
                 vector_id, uid_param
@@ -324,9 +315,7 @@ async def process_single_product(uid: str):
 async def get_sample_products(limit: int = 5):
     """🧪 테스트용 샘플 제품 목록 조회"""
     try:
-        pg_manager = PostgreSQLManager()
-        
-        async with pg_manager.get_connection() as conn:
+        async with postgres_manager.get_connection() as conn:
             products = await conn.fetch(
                 """
                 SELECT uid, pid, provider_uid, title, is_conversion, vector_id
@@ -363,8 +352,6 @@ async def get_sample_products(limit: int = 5):
 async def get_qdrant_test_status():
     """🔍 Qdrant 컬렉션 상태 확인"""
     try:
-        qdrant_manager = QdrantManager()
-        
         # 컬렉션 정보 조회
         collections = await qdrant_manager.list_collections()
         collection_name = config.QDRANT_COLLECTION
@@ -396,10 +383,8 @@ async def process_small_batch(start_uid: int, count: int = 10):
         if count > 50:
             raise HTTPException(status_code=400, detail="count는 50 이하여야 합니다")
         
-        pg_manager = PostgreSQLManager()
-        
         # 처리할 제품들 조회
-        async with pg_manager.get_connection() as conn:
+        async with postgres_manager.get_connection() as conn:
             products = await conn.fetch(
                 """
                 SELECT uid FROM product 
@@ -471,13 +456,11 @@ async def direct_sync(request: SyncRequest):
     try:
         # 직접 동기화 로직 (큐 없이)
         embedding_service = EmbeddingService()
-        pg_manager = PostgreSQLManager()
-        qdrant_manager = QdrantManager()
         
         processed_count = 0
         failed_count = 0
         
-        async with pg_manager.get_connection() as conn:
+        async with postgres_manager.get_connection() as conn:
             if request.product_uid:
                 # 특정 UID 동기화
                 try:
@@ -510,11 +493,8 @@ async def direct_sync(request: SyncRequest):
 async def get_processing_status():
     """현재 처리 상태 확인 (폴링용)"""
     try:
-        pg_manager = PostgreSQLManager()
-        qdrant_manager = QdrantManager()
-        
         # 데이터베이스 상태 확인
-        async with pg_manager.get_connection() as conn:
+        async with postgres_manager.get_connection() as conn:
             # 총 제품 수
             total_products = await conn.fetchval("SELECT COUNT(*) FROM products")
             
@@ -553,7 +533,6 @@ async def get_processing_status():
 async def optimize_qdrant_collection():
     """🧹 Qdrant 컬렉션 최적화 실행"""
     try:
-        qdrant_manager = QdrantManager()
         result = await qdrant_manager.optimize_collection()
         
         return {
@@ -569,7 +548,6 @@ async def optimize_qdrant_collection():
 async def get_qdrant_storage_stats():
     """📊 Qdrant 스토리지 사용량 및 성능 통계"""
     try:
-        qdrant_manager = QdrantManager()
         stats = await qdrant_manager.get_storage_stats()
         
         return {
@@ -616,9 +594,7 @@ async def batch_upload_optimized(
 async def get_products_count():
     """제품 수 조회"""
     try:
-        pg_manager = PostgreSQLManager()
-        
-        async with pg_manager.get_connection() as conn:
+        async with postgres_manager.get_connection() as conn:
             total_count = await conn.fetchval("SELECT COUNT(*) FROM products")
             
             # 제공업체별 수
@@ -640,9 +616,7 @@ async def get_products_count():
 async def get_recent_products(limit: int = 10):
     """최근 제품 목록 조회"""
     try:
-        pg_manager = PostgreSQLManager()
-        
-        async with pg_manager.get_connection() as conn:
+        async with postgres_manager.get_connection() as conn:
             rows = await conn.fetch(
                 "SELECT uid, title, provider, price, created_at "
                 "FROM products ORDER BY created_at DESC LIMIT $1",
@@ -673,11 +647,8 @@ async def get_recent_products(limit: int = 10):
 async def get_product_sync_status(product_uid: str):
     """특정 제품의 동기화 상태 확인"""
     try:
-        pg_manager = PostgreSQLManager()
-        qdrant_manager = QdrantManager()
-        
         # PostgreSQL에서 제품 정보 조회
-        async with pg_manager.get_connection() as conn:
+        async with postgres_manager.get_connection() as conn:
             product = await conn.fetchrow(
                 "SELECT uid, title, provider, updated_at FROM products WHERE uid = $1",
                 product_uid
@@ -851,11 +822,10 @@ async def poll_and_sync():
                 
                 # PostgreSQL 업데이트: is_conversion=true, vector_id 설정
                 async with postgres_manager.get_connection() as conn:
-                    for provider_uid, pid, vector_uuid in successful_inserts:
-                        await conn.execute(
-                            "UPDATE product SET is_conversion = true, vector_id = $1, updated_dt = NOW() WHERE provider_uid = $2 AND pid = $3",
-                            vector_uuid, provider_uid, pid
-                        )
+                    await conn.executemany(
+                        "UPDATE product SET is_conversion = true, vector_id = $1, updated_dt = NOW() WHERE provider_uid = $2 AND pid = $3",
+                        [(vector_uuid, provider_uid, pid) for provider_uid, pid, vector_uuid in successful_inserts]
+                    )
                 
                 results["insert_count"] = len(successful_inserts)
                 logger.info(f"✅ INSERT 완료: {len(successful_inserts)}개 상품")
@@ -872,12 +842,10 @@ async def poll_and_sync():
                 
                 # PostgreSQL 업데이트: vector_id를 null로 설정
                 async with postgres_manager.get_connection() as conn:
-                    for product in delete_products:
-                        if product['vector_id']:
-                            await conn.execute(
-                                "UPDATE product SET vector_id = NULL, updated_dt = NOW() WHERE provider_uid = $1 AND pid = $2",
-                                product['provider_uid'], product['pid']
-                            )
+                    await conn.executemany(
+                        "UPDATE product SET vector_id = NULL, updated_dt = NOW() WHERE provider_uid = $1 AND pid = $2",
+                        [(product['provider_uid'], product['pid']) for product in delete_products if product['vector_id']]
+                    )
                 
                 results["delete_count"] = len(vector_ids_to_delete)
                 logger.info(f"✅ DELETE 완료: {len(vector_ids_to_delete)}개 상품")
@@ -964,11 +932,10 @@ async def poll_and_sync():
                 
                 # PostgreSQL 업데이트: is_conversion=true
                 async with postgres_manager.get_connection() as conn:
-                    for provider_uid, pid in successful_updates:
-                        await conn.execute(
-                            "UPDATE product SET is_conversion = true, updated_dt = NOW() WHERE provider_uid = $1 AND pid = $2",
-                            provider_uid, pid
-                        )
+                    await conn.executemany(
+                        "UPDATE product SET is_conversion = true, updated_dt = NOW() WHERE provider_uid = $1 AND pid = $2",
+                        successful_updates
+                    )
                 
                 results["update_count"] = len(successful_updates)
                 logger.info(f"✅ UPDATE 완료: {len(successful_updates)}개 상품 (삭제 후 재삽입)")
@@ -1141,11 +1108,10 @@ async def poll_and_sync_test(limit: int = 100):
                 # PostgreSQL 업데이트: is_conversion=true, vector_id 설정
                 logger.info(f"📊 PostgreSQL 상태 업데이트 중...")
                 async with postgres_manager.get_connection() as conn:
-                    for provider_uid, pid, vector_uuid in successful_inserts:
-                        await conn.execute(
-                            "UPDATE product SET is_conversion = true, vector_id = $1, updated_dt = NOW() WHERE provider_uid = $2 AND pid = $3",
-                            vector_uuid, provider_uid, pid
-                        )
+                    await conn.executemany(
+                        "UPDATE product SET is_conversion = true, vector_id = $1, updated_dt = NOW() WHERE provider_uid = $2 AND pid = $3",
+                        [(vector_uuid, provider_uid, pid) for provider_uid, pid, vector_uuid in successful_inserts]
+                    )
                 
                 results["insert_count"] = len(successful_inserts)
                 logger.info(f"✅ INSERT 완료: {len(successful_inserts)}개 상품")
@@ -1162,12 +1128,10 @@ async def poll_and_sync_test(limit: int = 100):
                 
                 # PostgreSQL 업데이트: vector_id를 null로 설정
                 async with postgres_manager.get_connection() as conn:
-                    for product in delete_products:
-                        if product['vector_id']:
-                            await conn.execute(
-                                "UPDATE product SET vector_id = NULL, updated_dt = NOW() WHERE provider_uid = $1 AND pid = $2",
-                                product['provider_uid'], product['pid']
-                            )
+                    await conn.executemany(
+                        "UPDATE product SET vector_id = NULL, updated_dt = NOW() WHERE provider_uid = $1 AND pid = $2",
+                        [(product['provider_uid'], product['pid']) for product in delete_products if product['vector_id']]
+                    )
                 
                 results["delete_count"] = len(vector_ids_to_delete)
                 logger.info(f"✅ DELETE 완료: {len(vector_ids_to_delete)}개 상품")
@@ -1254,11 +1218,10 @@ async def poll_and_sync_test(limit: int = 100):
                 
                 # PostgreSQL 업데이트: is_conversion=true
                 async with postgres_manager.get_connection() as conn:
-                    for provider_uid, pid in successful_updates:
-                        await conn.execute(
-                            "UPDATE product SET is_conversion = true, updated_dt = NOW() WHERE provider_uid = $1 AND pid = $2",
-                            provider_uid, pid
-                        )
+                    await conn.executemany(
+                        "UPDATE product SET is_conversion = true, updated_dt = NOW() WHERE provider_uid = $1 AND pid = $2",
+                        successful_updates
+                    )
                 
                 results["update_count"] = len(successful_updates)
                 logger.info(f"✅ UPDATE 완료: {len(successful_updates)}개 상품 (삭제 후 재삽입)")
@@ -140,9 +140,11 @@ class PostgreSQLManager:
         """
         return await self.execute_query(query, batch_size)
     
-    async def health_check(self) -> bool:
-        """PostgreSQL 연결 상태 확인"""
+    async def health_check(self, conn: Optional[asyncpg.Connection] = None) -> bool:
+        """PostgreSQL 연결 상태 확인 (conn이 주어지면 해당 연결 재사용)"""
         try:
+            if conn is not None:
+                return await conn.fetchval("SELECT 1") == 1
             result = await self.execute_single("SELECT 1 as health")
             return result['health'] == 1 if result else False
         except Exception as e:
@@ -297,7 +297,6 @@ class QdrantManager:
             
             # 병렬 배치 처리를 위한 세마포어
             semaphore = asyncio.Semaphore(parallel_batches)
-            operation_ids = []
             
             async def process_batch(batch_points: List[PointStruct], batch_idx: int):
                 async with semaphore:
@@ -313,13 +312,18 @@ class QdrantManager:
                         logger.error(f"배치 {batch_idx + 1} 업로드 실패: {e}")
                         raise
             
-            # 모든 배치를 병렬로 처리
-            tasks = [
-                process_batch(batch, idx) 
-                for idx, batch in enumerate(batches)
-            ]
+            # 모든 배치를 병렬로 처리 (TaskGroup: 하나라도 실패하면 나머지 배치 취소)
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(process_batch(batch, idx))
+                        for idx, batch in enumerate(batches)
+                    ]
+            except* Exception as eg:
+                # ExceptionGroup 대신 첫 번째 배치의 실제 Qdrant 에러를 그대로 전달 (각 배치 에러는 위에서 이미 로깅됨)
+                raise eg.exceptions[0]
             
-            operation_ids = await asyncio.gather(*tasks)
+            operation_ids = [task.result() for task in tasks]
             
             logger.info(f"✅ 배치 최적화 업로드 완료: {total_points}개 포인트 처리됨")
             return {
@@ -3,7 +3,7 @@ from fastapi.responses import RedirectResponse, HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 from src.config import get_settings
-from src.api.router import api_router
+from src.api.router import api_router, postgres_manager, qdrant_manager
 from src.auth.router import router as auth_router
 import os
 from contextlib import asynccontextmanager
@@ -22,13 +22,26 @@ config = get_settings()
 # Determine the environment
 environment = os.getenv('ENVIRONMENT', 'dev')
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 첫 요청 전에 PostgreSQL 풀과 Qdrant 클라이언트 연결을 미리 생성 (콜드 스타트 핸드셰이크 제거)
+    pg_ready, qdrant_ready = await asyncio.gather(
+        postgres_manager.health_check(),
+        qdrant_manager.health_check()
+    )
+    logger.info(f"연결 풀 워밍업 완료 - PostgreSQL: {pg_ready}, Qdrant: {qdrant_ready}")
+    yield
+    await postgres_manager.close()
+    await qdrant_manager.close()
+
 # Initiate app with conditional documentation
 if environment in ['dev']:
-    app = FastAPI(title=config.app_name, root_path="/indexer")  # Enable docs in 'dev' and 'loc'
+    app = FastAPI(title=config.app_name, root_path="/indexer", lifespan=lifespan)  # Enable docs in 'dev' and 'loc'
 else:
     app = FastAPI(
         title=config.app_name,
-        root_path="/indexer"
+        root_path="/indexer",
+        lifespan=lifespan
     )
 # CORS 설정 추가
 app.add_middleware(
@@ -142,7 +142,7 @@ class MetricsCollector:
         def decorator(func: Callable) -> Callable:
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 status = 'processed'
                 
                 try:
@@ -153,7 +153,7 @@ class MetricsCollector:
                     logger.error(f"Redis job failed: {e}")
                     raise
                 finally:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     REDIS_JOB_DURATION.labels(
                         queue_name=queue_name,
                         job_type=job_type
@@ -165,7 +165,7 @@ class MetricsCollector:
                     
             @functools.wraps(func)
             def sync_wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 status = 'processed'
                 
                 try:
@@ -176,7 +176,7 @@ class MetricsCollector:
                     logger.error(f"Redis job failed: {e}")
                     raise
                 finally:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     REDIS_JOB_DURATION.labels(
                         queue_name=queue_name,
                         job_type=job_type
@@ -195,7 +195,7 @@ class MetricsCollector:
         def decorator(func: Callable) -> Callable:
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 status = 'success'
                 
                 try:
@@ -211,13 +211,13 @@ class MetricsCollector:
                     logger.error(f"Embedding generation failed: {e}")
                     raise
                 finally:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     EMBEDDING_GENERATION_DURATION.labels(model=model).observe(duration)
                     EMBEDDINGS_GENERATED_TOTAL.labels(model=model, status=status).inc()
                     
             @functools.wraps(func)
             def sync_wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 status = 'success'
                 
                 try:
@@ -233,7 +233,7 @@ class MetricsCollector:
                     logger.error(f"Embedding generation failed: {e}")
                     raise
                 finally:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     EMBEDDING_GENERATION_DURATION.labels(model=model).observe(duration)
                     EMBEDDINGS_GENERATED_TOTAL.labels(model=model, status=status).inc()
                     
@@ -246,7 +246,7 @@ class MetricsCollector:
         def decorator(func: Callable) -> Callable:
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 status = 'success'
                 
                 try:
@@ -257,7 +257,7 @@ class MetricsCollector:
                     logger.error(f"DB query failed: {e}")
                     raise
                 finally:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     DB_QUERY_DURATION.labels(
                         database=database,
                         operation=operation
@@ -270,7 +270,7 @@ class MetricsCollector:
                     
             @functools.wraps(func)
             def sync_wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 status = 'success'
                 
                 try:
@@ -281,7 +281,7 @@ class MetricsCollector:
                     logger.error(f"DB query failed: {e}")
                     raise
                 finally:
-                    duration = time.time() - start_time
+                    duration = time.perf_counter() - start_time
                     DB_QUERY_DURATION.labels(
                         database=database,
                         operation=operation
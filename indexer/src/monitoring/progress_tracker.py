@@ -7,6 +7,7 @@
 import asyncio
 import json
 import time
+from operator import attrgetter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, asdict
@@ -443,7 +444,7 @@ class ProgressTracker:
         return {
             "session": self.session.to_dict(),
             "current_batch": self.current_batch.to_dict() if self.current_batch else None,
-            "completed_batches": len([b for b in self.batches.values() if b.is_completed]),
+            "completed_batches": sum(map(attrgetter("is_completed"), self.batches.values())),
             "total_batches": len(self.batches),
             "system_memory_mb": self._get_memory_usage(),
             "system_cpu_percent": psutil.cpu_percent()
@@ -1,9 +1,12 @@
 # src/services/embedding_service.py
 import os
+import re
+import hashlib
 import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass
+from collections import OrderedDict
 import time
 import openai
 from openai import OpenAI, AsyncOpenAI
@@ -18,6 +21,9 @@ from ..monitoring.metrics import MetricsCollector
 
 logger = logging.getLogger(__name__)
 
+# 한글 음절 패턴 (토큰 수 추정용)
+HANGUL_PATTERN = re.compile(r'[가-힣]')
+
 @dataclass
 class EmbeddingConfig:
     """임베딩 서비스 설정"""
@@ -29,6 +35,8 @@ class EmbeddingConfig:
     batch_size: int = 100  # 배치당 최대 텍스트 수
     max_tokens_per_text: int = 8000  # 텍스트당 최대 토큰
     request_timeout: float = 30.0  # API 요청 타임아웃
+    max_concurrent_requests: int = 8  # 비동기 배치 동시 요청 수
+    cache_size: int = 256  # 단일 텍스트 임베딩 LRU 캐시 크기 (0이면 비활성화)
     
     # Rate limiting 설정
     requests_per_minute: int = 5000  # OpenAI 기본 제한
@@ -50,13 +58,13 @@ class RateLimiter:
     
     def can_make_request(self, estimated_tokens: int = 1000) -> bool:
         """요청 가능 여부 확인"""
-        current_time = time.time()
+        current_time = time.perf_counter()
         minute_ago = current_time - 60
         
         with self._lock:
             # 1분 이전 기록 제거
             self.request_times = [t for t in self.request_times if t > minute_ago]
-            self.token_counts = [(t, c) for t, c in self.token_counts if t > minute_ago]
+            self.token_counts = [entry for entry in self.token_counts if entry[0] > minute_ago]
             
             # 현재 사용량 계산
             current_requests = len(self.request_times)
@@ -72,7 +80,7 @@ class RateLimiter:
     
     def record_request(self, tokens_used: int):
         """요청 기록"""
-        current_time = time.time()
+        current_time = time.perf_counter()
         
         with self._lock:
             self.request_times.append(current_time)
@@ -80,35 +88,61 @@ class RateLimiter:
     
     def wait_time_needed(self, estimated_tokens: int = 1000) -> float:
         """요청 가능할 때까지 대기 시간 계산"""
-        current_time = time.time()
-        minute_ago = current_time - 60
+        with self._lock:
+            return self._wait_time_locked(time.perf_counter(), estimated_tokens)
+    
+    def try_acquire(self, estimated_tokens: int = 1000) -> tuple[Optional[list], float]:
+        """예상 토큰을 lock 안에서 확인과 동시에 예약 (동시 배치가 같은 여유분을 중복 사용하지 않도록)
+        
+        Returns:
+            (예약 항목, 0.0) 또는 예약 실패 시 (None, 필요한 대기 시간)
+        """
+        current_time = time.perf_counter()
         
         with self._lock:
-            # 최근 요청들
-            recent_requests = [t for t in self.request_times if t > minute_ago]
-            recent_tokens = [(t, c) for t, c in self.token_counts if t > minute_ago]
+            wait_time = self._wait_time_locked(current_time, estimated_tokens)
+            if wait_time > 0:
+                return None, wait_time
             
-            wait_times = []
-            
-            # 요청 수 제한으로 인한 대기
-            if len(recent_requests) >= self.requests_per_minute:
-                oldest_request = min(recent_requests)
-                wait_times.append(oldest_request + 60 - current_time)
-            
-            # 토큰 제한으로 인한 대기
-            current_tokens = sum(c for _, c in recent_tokens)
-            if current_tokens + estimated_tokens > self.tokens_per_minute:
-                # 토큰이 충분할 때까지 대기 시간 계산
-                sorted_tokens = sorted(recent_tokens, key=lambda x: x[0])
-                tokens_needed = current_tokens + estimated_tokens - self.tokens_per_minute
-                
-                for timestamp, token_count in sorted_tokens:
-                    tokens_needed -= token_count
-                    if tokens_needed <= 0:
-                        wait_times.append(timestamp + 60 - current_time)
-                        break
+            reservation = [current_time, estimated_tokens]
+            self.request_times.append(current_time)
+            self.token_counts.append(reservation)
+            return reservation, 0.0
+    
+    def settle(self, reservation: list, tokens_used: int):
+        """예약한 토큰 수를 실제 사용량으로 교체"""
+        with self._lock:
+            reservation[1] = tokens_used
+    
+    def _wait_time_locked(self, current_time: float, estimated_tokens: int) -> float:
+        """대기 시간 계산 (호출자가 self._lock 보유)"""
+        minute_ago = current_time - 60
+        
+        # 1분 이전 기록 제거
+        self.request_times = [t for t in self.request_times if t > minute_ago]
+        self.token_counts = [entry for entry in self.token_counts if entry[0] > minute_ago]
+        
+        wait_times = []
+        
+        # 요청 수 제한으로 인한 대기
+        if len(self.request_times) >= self.requests_per_minute:
+            oldest_request = min(self.request_times)
+            wait_times.append(oldest_request + 60 - current_time)
+        
+        # 토큰 제한으로 인한 대기
+        current_tokens = sum(c for _, c in self.token_counts)
+        if current_tokens + estimated_tokens > self.tokens_per_minute:
+            # 토큰이 충분할 때까지 대기 시간 계산
+            sorted_tokens = sorted(self.token_counts, key=lambda x: x[0])
+            tokens_needed = current_tokens + estimated_tokens - self.tokens_per_minute
             
-            return max(wait_times) if wait_times else 0.0
+            for timestamp, token_count in sorted_tokens:
+                tokens_needed -= token_count
+                if tokens_needed <= 0:
+                    wait_times.append(timestamp + 60 - current_time)
+                    break
+        
+        return max(wait_times) if wait_times else 0.0
 
 class EmbeddingService:
     """OpenAI 임베딩 서비스 클래스"""
@@ -155,12 +189,17 @@ class EmbeddingService:
             self.config.tokens_per_minute
         )
         
+        # 단일 텍스트 임베딩 LRU 캐시 (키: 텍스트 SHA-256 digest)
+        self._cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         logger.info(f"임베딩 서비스 초기화: {self.config.model} ({self.config.dimensions}차원)")
     
     def estimate_tokens(self, text: str) -> int:
         """텍스트의 토큰 수 추정 (간단한 추정법)"""
         # 대략적인 추정: 영어는 4자당 1토큰, 한국어는 2자당 1토큰
-        korean_chars = len([c for c in text if '가' <= c <= '힣'])
+        # 문자 단위 파이썬 루프 대신 정규식(C 구현)으로 한글 문자 수 계산 (치환 문자열을 만들지 않고 매치 수만 셈)
+        korean_chars = len(HANGUL_PATTERN.findall(text))
         other_chars = len(text) - korean_chars
         return korean_chars // 2 + other_chars // 4
     
@@ -196,10 +235,34 @@ class EmbeddingService:
         logger.error(f"알 수 없는 에러: {error}")
         return False
     
-    @MetricsCollector.track_embedding_generation("text-embedding-3-large")
     def create_embedding(self, text: str) -> Optional[np.ndarray]:
-        """단일 텍스트의 임베딩 생성"""
-        return self.create_embeddings([text])[0] if text.strip() else None
+        """단일 텍스트의 임베딩 생성 (동일 텍스트는 LRU 캐시에서 반환, 캐시 적중은 생성 메트릭에 집계하지 않음)"""
+        if not text.strip():
+            return None
+        if self.config.cache_size <= 0:
+            return self._create_embedding_uncached(text)
+        
+        key = hashlib.sha256(text.strip().encode('utf-8')).digest()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached.copy()
+        
+        embedding = self._create_embedding_uncached(text)
+        if embedding is not None:
+            with self._cache_lock:
+                self._cache[key] = embedding
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.config.cache_size:
+                    self._cache.popitem(last=False)
+            embedding = embedding.copy()
+        return embedding
+    
+    @MetricsCollector.track_embedding_generation("text-embedding-3-large")
+    def _create_embedding_uncached(self, text: str) -> Optional[np.ndarray]:
+        """단일 텍스트 임베딩을 API로 생성 (캐시 미스 경로)"""
+        return self.create_embeddings([text])[0]
     
     @MetricsCollector.track_embedding_generation("text-embedding-3-large")
     def create_embeddings(self, texts: List[str]) -> List[Optional[np.ndarray]]:
@@ -331,16 +394,25 @@ class EmbeddingService:
         
         results = [None] * len(texts)
         
-        # 배치 처리
-        for i in range(0, len(valid_texts), self.config.batch_size):
-            batch_texts = valid_texts[i:i + self.config.batch_size]
-            batch_indices = valid_indices[i:i + self.config.batch_size]
-            
-            batch_embeddings = await self._create_batch_embeddings_async(batch_texts)
-            
-            for j, embedding in enumerate(batch_embeddings):
-                original_index = batch_indices[j]
-                results[original_index] = embedding
+        # 길이순 정렬로 배치별 토큰 수를 고르게 맞춰 꼬리 지연 감소
+        order = sorted(range(len(valid_texts)), key=lambda k: len(valid_texts[k]))
+        batches = [
+            order[i:i + self.config.batch_size]
+            for i in range(0, len(order), self.config.batch_size)
+        ]
+        
+        # 배치 요청을 동시에 실행 (세마포어로 동시 요청 수 제한)
+        semaphore = asyncio.Semaphore(min(len(batches), self.config.max_concurrent_requests))
+        
+        async def process_batch(batch: List[int]) -> None:
+            async with semaphore:
+                batch_embeddings = await self._create_batch_embeddings_async(
+                    [valid_texts[k] for k in batch]
+                )
+            for k, embedding in zip(batch, batch_embeddings):
+                results[valid_indices[k]] = embedding
+        
+        await asyncio.gather(*(process_batch(batch) for batch in batches))
         
         return results
     
@@ -348,9 +420,11 @@ class EmbeddingService:
         """비동기 배치 임베딩 생성 (내부 메서드)"""
         total_estimated_tokens = sum(self.estimate_tokens(text) for text in texts)
         
-        # Rate limiting 체크
-        wait_time = self.rate_limiter.wait_time_needed(total_estimated_tokens)
-        if wait_time > 0:
+        # Rate limiting: 예상 토큰을 먼저 예약한 뒤 요청 (동시 배치끼리 한도를 나눠 씀)
+        while True:
+            reservation, wait_time = self.rate_limiter.try_acquire(total_estimated_tokens)
+            if reservation is not None:
+                break
             logger.info(f"Rate limit 대기: {wait_time:.1f}초")
             await asyncio.sleep(wait_time)
         
@@ -365,7 +439,7 @@ class EmbeddingService:
                 )
                 
                 tokens_used = response.usage.total_tokens
-                self.rate_limiter.record_request(tokens_used)
+                self.rate_limiter.settle(reservation, tokens_used)
                 
                 embeddings = []
                 for embedding_data in response.data:
@@ -398,6 +472,7 @@ class EmbeddingService:
             "model": self.config.model,
             "dimensions": self.config.dimensions,
             "batch_size": self.config.batch_size,
+            "cache_entries": len(self._cache),
             "rate_limiter": {
                 "requests_per_minute": self.config.requests_per_minute,
                 "tokens_per_minute": self.config.tokens_per_minute,
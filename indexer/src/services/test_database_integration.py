@@ -13,13 +13,40 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.config import get_settings
 from src.database import postgres_manager, qdrant_manager
-from src.services.text_preprocessor import ProductTextPreprocessor
+from src.services.text_preprocessor import text_preprocessor
 from src.services.batch_processor import BatchProcessor, BatchConfig
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+# 로깅 설정 (기본은 WARNING으로 낮춰 로그 I/O를 줄이고, TEST_VERBOSE 설정 시 INFO 출력)
+logging.basicConfig(level=logging.INFO if os.getenv("TEST_VERBOSE") else logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# 설정은 한 번만 로드해 모든 테스트에서 재사용
+settings = get_settings()
+
+# 테스트 고정 데이터 (모듈 로드 시 한 번만 생성, 읽기 전용으로 공유)
+TEST_PRODUCT = {
+    'title': '야마하 YZF-R3 판매합니다',
+    'price': 800,
+    'year': 2020,
+    'mileage': 15000,
+    'content': '깔끔한 상태입니다. 정기점검 받았어요.'
+}
+
+TEST_TEXTS = [
+    "[YAMAHA R3] 야마하 YZF-R3 판매합니다 스펙: 2020년 | 800만원 | 15,000km 상세: 깔끔한 상태입니다.",
+    "[HONDA CBR] 혼다 CBR600RR 급매 스펙: 2019년 | 1200만원 | 8,500km 상세: 풀 정비 완료된 상태입니다."
+]
+
+TEST_VECTOR = [0.1] * 3072  # 3072차원 더미 벡터
+
+TEST_METADATA = {
+    'uid': 999999,  # 테스트용 ID
+    'title': '테스트 매물',
+    'price': 1000,
+    'content': '테스트 내용입니다.',
+    'processed_text': '[TEST] 테스트 매물 스펙: 2023년 | 1000만원 상세: 테스트 내용'
+}
+
 async def test_database_connections():
     """데이터베이스 연결 테스트"""
     print("\n🔌 데이터베이스 연결 테스트")
@@ -44,19 +71,11 @@ async def test_text_preprocessing():
     print("\n📝 텍스트 전처리 테스트")
     
     try:
-        preprocessor = ProductTextPreprocessor()
-        
-        # 테스트 데이터
-        test_product = {
-            'title': '야마하 YZF-R3 판매합니다',
-            'price': 800,
-            'year': 2020,
-            'mileage': 15000,
-            'content': '깔끔한 상태입니다. 정기점검 받았어요.'
-        }
+        # 모듈 전역 전처리기를 재사용 (테스트마다 정규식 패턴을 다시 만들지 않음)
+        preprocessor = text_preprocessor
         
         # 전처리 실행
-        processed_text = preprocessor.preprocess_product_data(test_product)
+        processed_text = preprocessor.preprocess_product_data(TEST_PRODUCT)
         print(f"✅ 전처리 결과: {processed_text}")
         
         return True
@@ -70,17 +89,11 @@ async def test_embedding_generation():
     print("\n🤖 임베딩 생성 테스트")
     
     try:
-        # 테스트 텍스트 리스트
-        test_texts = [
-            "[YAMAHA R3] 야마하 YZF-R3 판매합니다 스펙: 2020년 | 800만원 | 15,000km 상세: 깔끔한 상태입니다.",
-            "[HONDA CBR] 혼다 CBR600RR 급매 스펙: 2019년 | 1200만원 | 8,500km 상세: 풀 정비 완료된 상태입니다."
-        ]
-        
         # 배치 임베딩 생성
-        embeddings = await qdrant_manager.generate_embeddings_batch(test_texts)
+        embeddings = await qdrant_manager.generate_embeddings_batch(TEST_TEXTS)
         
         print(f"✅ 임베딩 생성 완료:")
-        for i, (text, embedding) in enumerate(zip(test_texts, embeddings)):
+        for i, (text, embedding) in enumerate(zip(TEST_TEXTS, embeddings)):
             if embedding is not None:
                 print(f"  - 텍스트 {i+1}: {len(embedding)}차원 벡터 생성")
             else:
@@ -101,27 +114,17 @@ async def test_qdrant_operations():
         collection_info = await qdrant_manager.get_collection_info()
         print(f"✅ 컬렉션 정보: {collection_info}")
         
-        # 테스트 벡터 데이터
-        test_vector = [0.1] * 3072  # 3072차원 더미 벡터
-        test_metadata = {
-            'uid': 999999,  # 테스트용 ID
-            'title': '테스트 매물',
-            'price': 1000,
-            'content': '테스트 내용입니다.',
-            'processed_text': '[TEST] 테스트 매물 스펙: 2023년 | 1000만원 상세: 테스트 내용'
-        }
-        
         # 벡터 업서트 테스트
         await qdrant_manager.upsert_vector_async(
             vector_id="999999",
-            vector=test_vector,
-            metadata=test_metadata
+            vector=TEST_VECTOR,
+            metadata=TEST_METADATA
         )
         print("✅ 테스트 벡터 업서트 완료")
         
         # 벡터 검색 테스트
         search_results = await qdrant_manager.search_similar_vectors(
-            query_vector=test_vector,
+            query_vector=TEST_VECTOR,
             limit=1
         )
         
@@ -167,9 +170,6 @@ async def test_batch_processor():
     print("\n⚙️ 배치 프로세서 통합 테스트")
     
     try:
-        # 설정에서 값 가져오기
-        settings = get_settings()
-        
         # 테스트용 배치 설정
         test_config = BatchConfig(
             batch_size=2,  # 작은 배치로 테스트
@@ -216,8 +216,6 @@ async def test_config_settings():
     print("\n⚙️ 설정 테스트")
     
     try:
-        settings = get_settings()
-        
         print(f"✅ 설정 로드 완료:")
         print(f"  - BATCH_SIZE: {settings.BATCH_SIZE}")
         print(f"  - MAX_RETRIES: {settings.MAX_RETRIES}")
@@ -246,30 +244,29 @@ async def main():
         ("배치 프로세서", test_batch_processor),
     ]
     
-    results = []
-    
-    for test_name, test_func in tests:
-        try:
-            result = await test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} 테스트 중 예외 발생: {e}")
-            results.append((test_name, False))
-    
-    # 결과 요약
+    # 각 테스트는 서로 다른 백엔드를 대상으로 하므로 동시에 실행 (출력 순서는 섞일 수 있음)
+    outcomes = await asyncio.gather(
+        *(test_func() for _, test_func in tests),
+        return_exceptions=True
+    )
+
+    # 결과 요약 (중간 결과 리스트 없이 한 번의 순회로 출력 및 집계)
     print("\n📊 테스트 결과 요약")
     print("=" * 50)
     
     passed = 0
-    for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
+    for (test_name, _), outcome in zip(tests, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {test_name} 테스트 중 예외 발생: {outcome}")
+            outcome = False
+        status = "✅ PASS" if outcome else "❌ FAIL"
         print(f"{status} {test_name}")
-        if result:
+        if outcome:
             passed += 1
     
-    print(f"\n총 {len(results)}개 테스트 중 {passed}개 통과 ({passed/len(results)*100:.1f}%)")
+    print(f"\n총 {len(tests)}개 테스트 중 {passed}개 통과 ({passed/len(tests)*100:.1f}%)")
     
-    if passed == len(results):
+    if passed == len(tests):
         print("🎉 모든 통합 테스트 통과!")
     else:
         print("⚠️ 일부 테스트 실패 - 로그를 확인하세요.")
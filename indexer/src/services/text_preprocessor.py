@@ -8,20 +8,40 @@ logger = logging.getLogger(__name__)
 class ProductTextPreprocessor:
     """매물 데이터를 임베딩에 적합한 텍스트로 전처리하는 클래스"""
     
+    # 불필요한 특수문자 및 패턴 정규화용 패턴들 (클래스 로드 시 한 번만 컴파일)
+    PATTERNS = {
+        # 연속된 공백을 하나로 줄이기
+        'multiple_spaces': re.compile(r'\s+'),
+        # 특수문자 정리 (필수 정보는 유지)
+        'special_chars': re.compile(r'[^\w\s가-힣.,!?()-]'),
+        # 가격 정규화 (만원, 천만원 등 단위 통일)
+        'price_units': re.compile(r'([0-9,]+)\s*(만원|천만원|억)'),
+        # 키로수 정규화 
+        'km_units': re.compile(r'([0-9,]+)\s*(km|키로|키로미터|킬로)'),
+        # 연식 정규화
+        'year_pattern': re.compile(r'(19|20)\d{2}'),
+    }
+    
+    # 주요 브랜드 패턴들 (우선순위 순서)
+    BRAND_PATTERNS = (
+        ('YAMAHA', re.compile(r'\b(야마하|yamaha|yamha)\b', re.IGNORECASE)),
+        ('HONDA', re.compile(r'\b(혼다|honda)\b', re.IGNORECASE)),
+        ('KAWASAKI', re.compile(r'\b(가와사키|kawasaki|카와사키)\b', re.IGNORECASE)),
+        ('SUZUKI', re.compile(r'\b(스즈키|suzuki)\b', re.IGNORECASE)),
+        ('DUCATI', re.compile(r'\b(두카티|ducati)\b', re.IGNORECASE)),
+        ('BMW', re.compile(r'\b(bmw|비엠더블유)\b', re.IGNORECASE)),
+    )
+    
+    # 모델 패턴들 (예시로 일부만)
+    MODEL_PATTERNS = (
+        ('R3', re.compile(r'\b(r-?3|알삼|알쓰리|yzf-?r-?3)\b', re.IGNORECASE)),
+        ('R6', re.compile(r'\b(r-?6|알식|yzf-?r-?6)\b', re.IGNORECASE)),
+        ('CBR', re.compile(r'\b(cbr)\b', re.IGNORECASE)),
+        ('NINJA', re.compile(r'\b(ninja|닌자)\b', re.IGNORECASE)),
+    )
+    
     def __init__(self):
-        # 불필요한 특수문자 및 패턴 정규화용 패턴들
-        self.patterns = {
-            # 연속된 공백을 하나로 줄이기
-            'multiple_spaces': re.compile(r'\s+'),
-            # 특수문자 정리 (필수 정보는 유지)
-            'special_chars': re.compile(r'[^\w\s가-힣.,!?()-]'),
-            # 가격 정규화 (만원, 천만원 등 단위 통일)
-            'price_units': re.compile(r'([0-9,]+)\s*(만원|천만원|억)'),
-            # 키로수 정규화 
-            'km_units': re.compile(r'([0-9,]+)\s*(km|키로|키로미터|킬로)'),
-            # 연식 정규화
-            'year_pattern': re.compile(r'(19|20)\d{2}'),
-        }
+        self.patterns = self.PATTERNS
     
     def clean_text(self, text: str) -> str:
         """기본 텍스트 정리"""
@@ -131,37 +151,19 @@ class ProductTextPreprocessor:
         """제목에서 브랜드와 모델명 추출"""
         title = title.lower() if title else ""
         
-        # 주요 브랜드 패턴들
-        brand_patterns = {
-            'yamaha': r'\b(야마하|yamaha|yamha)\b',
-            'honda': r'\b(혼다|honda)\b', 
-            'kawasaki': r'\b(가와사키|kawasaki|카와사키)\b',
-            'suzuki': r'\b(스즈키|suzuki)\b',
-            'ducati': r'\b(두카티|ducati)\b',
-            'bmw': r'\b(bmw|비엠더블유)\b'
-        }
-        
-        # 모델 패턴들 (예시로 일부만)
-        model_patterns = {
-            'r3': r'\b(r-?3|알삼|알쓰리|yzf-?r-?3)\b',
-            'r6': r'\b(r-?6|알식|yzf-?r-?6)\b',
-            'cbr': r'\b(cbr)\b',
-            'ninja': r'\b(ninja|닌자)\b'
-        }
-        
         detected_brand = ""
         detected_model = ""
         
         # 브랜드 감지
-        for brand, pattern in brand_patterns.items():
-            if re.search(pattern, title, re.IGNORECASE):
-                detected_brand = brand.upper()
+        for brand, pattern in self.BRAND_PATTERNS:
+            if pattern.search(title):
+                detected_brand = brand
                 break
         
         # 모델 감지  
-        for model, pattern in model_patterns.items():
-            if re.search(pattern, title, re.IGNORECASE):
-                detected_model = model.upper()
+        for model, pattern in self.MODEL_PATTERNS:
+            if pattern.search(title):
+                detected_model = model
                 break
         
         return {
@@ -1,28 +1,70 @@
+import asyncio
+import json
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
 from dotenv import load_dotenv
 from urllib.parse import quote_plus
+from core.logger import setup_logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 load_dotenv()
 
+logger = setup_logger(__name__)
+
 POSTGRES_USER = os.getenv("POSTGRES_USER")
 POSTGRES_PASSWORD = quote_plus(os.getenv("POSTGRES_PASSWORD"))
 POSTGRES_DB = os.getenv("POSTGRES_DB")
 POSTGRES_HOST = os.getenv("POSTGRES_HOST")
 POSTGRES_PORT = os.getenv("POSTGRES_PORT")
 
+# SQL 로그는 디버깅 시에만 (매 쿼리마다 로그 포맷팅 비용 발생)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# 기동 시 미리 열어둘 커넥션 수 (워커마다 풀 전체를 한꺼번에 열지 않도록 상한)
+DB_WARM_POOL_SIZE = int(os.getenv("DB_WARM_POOL_SIZE", str(min(DB_POOL_SIZE, 10))))
+# PgBouncer(transaction 모드) 경유 시 prepared statement 캐시 비활성화
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+# 커넥션별 prepared statement 캐시 크기 (반복되는 upsert/조회 쿼리의 parse/plan 재사용)
+DB_STATEMENT_CACHE_SIZE = 0 if DB_PGBOUNCER else int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+
 DATABASE_URL = (
     f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}"
     f"@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 )
+DATABASE_URL += f"?prepared_statement_cache_size={DB_STATEMENT_CACHE_SIZE}"
+
+# JSON 컬럼(product.rmk 등) 직렬화/역직렬화: orjson이 있으면 사용 (없으면 표준 json)
+if orjson is not None:
+    def json_serializer(obj) -> str:
+        return orjson.dumps(obj).decode()
+    json_deserializer = orjson.loads
+else:
+    json_serializer = json.dumps
+    json_deserializer = json.loads
+
+connect_args = {
+    "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+    "server_settings": {"jit": "off"}
+}
 
 engine = create_async_engine(
     DATABASE_URL,
-    echo=True,
+    echo=DB_ECHO,
     #connect_args={"ssl": True}
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
     pool_recycle=180,        # 180초마다 커넥션 재사용 방지
-    pool_pre_ping=True       # 커넥션 살아있는지 ping 확인
+    pool_pre_ping=True,      # 커넥션 살아있는지 ping 확인
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
+    connect_args=connect_args
 )
 
 AsyncSessionLocal = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
@@ -31,3 +73,17 @@ Base = declarative_base()
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
+
+async def warm_pool(size: int = DB_WARM_POOL_SIZE):
+    """기동 시 커넥션 풀을 일부 미리 채워 첫 요청의 연결 수립 지연 제거
+
+    지연 최적화일 뿐이므로 DB에 연결하지 못해도 기동은 계속 (이후 요청 시 지연 연결)
+    """
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(*(_ping() for _ in range(size)), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        logger.warning("⚠️ 커넥션 풀 예열 실패 %s/%s개 (지연 연결로 계속): %r", len(errors), size, errors[0])
@@ -0,0 +1,39 @@
+import asyncio
+import importlib.util
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# h2 패키지(httpx[http2])가 있으면 HTTP/2로 한 커넥션에서 여러 요청을 다중화
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+
+# 번개장터 API 전용 클라이언트 (상대 경로로 호출, 요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 커넥션 재사용)
+bunjang_client = httpx.AsyncClient(
+    base_url="https://api.bunjang.co.kr",
+    timeout=10.0,
+    limits=HTTP_LIMITS,
+    http2=HTTP2_ENABLED,
+    headers={"User-Agent": "finally-scraper/0.1"}
+)
+
+def response_json(res: httpx.Response):
+    # orjson이 설치되어 있으면 C 파서로 바로 디코딩 (없으면 httpx 기본 json)
+    if orjson is not None:
+        return orjson.loads(res.content)
+    return res.json()
+
+# 이 크기 이상의 응답은 워커 스레드에서 디코딩 (이벤트 루프 블로킹 방지)
+LARGE_RESPONSE_BYTES = 256 * 1024
+
+async def response_json_async(res: httpx.Response):
+    if len(res.content) >= LARGE_RESPONSE_BYTES:
+        return await asyncio.to_thread(response_json, res)
+    return response_json(res)
+
+async def close_http_client():
+    await bunjang_client.aclose()
@@ -1,5 +1,8 @@
 import os
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 
 # 로그 디렉토리 생성
@@ -25,22 +28,27 @@ formatter = CustomFormatter(
     datefmt="%Y-%m-%d %H:%M:%S.%f"
 )
 
+# 콘솔 핸들러
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(formatter)
+
+# 파일 핸들러 (오늘 날짜 파일)
+file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
+file_handler.setFormatter(formatter)
+
+# 실제 콘솔/파일 쓰기는 백그라운드 리스너 스레드에서 처리 (이벤트 루프가 디스크 I/O로 막히지 않도록)
+_log_queue = queue.Queue(-1)
+_listener = QueueListener(_log_queue, console_handler, file_handler, respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
+
 # 공통 핸들러 설정 (다른 모듈에서도 재사용 가능)
 def setup_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
 
     if not logger.handlers:
-        # 콘솔 핸들러
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-
-        # 파일 핸들러 (오늘 날짜 파일)
-        file_handler = logging.FileHandler(log_file_path, encoding="utf-8")
-        file_handler.setFormatter(formatter)
-
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+        logger.addHandler(QueueHandler(_log_queue))
 
     return logger
 
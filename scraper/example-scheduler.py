@@ -1,8 +1,14 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 import asyncio
+from typing import Callable
 from datetime import datetime
 
+try:
+    import uvloop  # fastapi[standard] -> uvicorn[standard] 경유로 설치됨
+except ImportError:
+    uvloop = None
+
 # === 1. 글로벌 크론 문자열 선언 ===
 crons = """
 0 * * * * functionA
@@ -22,10 +28,10 @@ FUNCTION_MAP = {
     "functionB": functionB,
 }
 
-# === 4. 크론 문자열 파싱 및 스케줄러 등록 ===
-def start_scheduler():
-    scheduler = AsyncIOScheduler()
-    for line in crons.strip().splitlines():
+# === 4. 크론 문자열 파싱 (모듈 로드 시 한 번만, 잘못된 설정은 즉시 확인) ===
+def _parse_crons(text: str) -> list[tuple[str, str, CronTrigger, Callable]]:
+    jobs = []
+    for line in text.strip().splitlines():
         parts = line.strip().split()
         if len(parts) != 6:
             print(f"잘못된 형식: {line}")
@@ -37,16 +43,32 @@ def start_scheduler():
         if not func:
             print(f"등록되지 않은 함수: {func_name}")
             continue
+        jobs.append((cron_expr, func_name, CronTrigger.from_crontab(cron_expr), func))
+    return jobs
+
+_JOBS = _parse_crons(crons)
+
+# === 5. 스케줄러 등록 ===
+def start_scheduler():
+    scheduler = AsyncIOScheduler()
+    for cron_expr, func_name, trigger, func in _JOBS:
         # APScheduler에 등록
-        scheduler.add_job(func, CronTrigger.from_crontab(cron_expr))
+        scheduler.add_job(func, trigger)
         print(f"등록: {cron_expr} -> {func_name}()")
     scheduler.start()
     print("스케줄러 시작됨.")
 
 # === 0. 실행python scheduler.py ===
-if __name__ == "__main__":
+async def _main():
     start_scheduler()
+    # 종료 신호가 올 때까지 대기
+    await asyncio.Event().wait()
+
+if __name__ == "__main__":
     try:
-        asyncio.get_event_loop().run_forever()
+        if uvloop:
+            uvloop.run(_main())
+        else:
+            asyncio.run(_main())
     except (KeyboardInterrupt, SystemExit):
         pass
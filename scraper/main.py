@@ -1,13 +1,20 @@
+import os
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
-from core.database import engine, Base
+from core.database import engine, Base, warm_pool
+from core.http import close_http_client
 from routers import sync
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    #async with engine.begin() as conn:
-        #await conn.run_sync(Base.metadata.create_all)
+    # 스키마 생성은 RUN_DDL=1 일 때만 (평소 기동 시 테이블 존재 확인 쿼리 생략)
+    if os.getenv("RUN_DDL") == "1":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    await warm_pool()
     yield
+    await close_http_client()
+    await engine.dispose()
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(sync.router)
@@ -0,0 +1,51 @@
+-- migrations/add_product_unique_and_indexes.sql
+-- 기존 DB에 (provider_uid, pid) 유니크 제약, 변경 감지용 content_hash 컬럼, upsert/비교/삭제용 인덱스 추가
+-- (finally.ddl은 전체 DROP/CREATE 용이므로 운영 중인 DB에는 이 파일을 적용)
+
+BEGIN;
+
+-- 1. (provider_uid, pid) 중복 정리: 가장 최근에 생성된 행(uid 최대)만 남김
+--    삭제될 상품에 연결된 file 행을 먼저 정리 (FK가 SET NULL이라 고아 행이 남지 않도록)
+DELETE FROM file f
+USING product p
+WHERE f.product_uid = p.uid
+  AND EXISTS (
+      SELECT 1 FROM product d
+      WHERE d.provider_uid = p.provider_uid
+        AND d.pid = p.pid
+        AND d.uid > p.uid
+  );
+
+DELETE FROM product p
+USING product d
+WHERE d.provider_uid = p.provider_uid
+  AND d.pid = p.pid
+  AND d.uid > p.uid;
+
+-- 2. 유니크 제약 추가 (INSERT ... ON CONFLICT (provider_uid, pid) 대상)
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'uq_product_provider_pid'
+    ) THEN
+        ALTER TABLE product
+            ADD CONSTRAINT uq_product_provider_pid UNIQUE (provider_uid, pid);
+    END IF;
+END
+$$;
+
+-- 3. 변경 감지용 내용 해시 컬럼 (기존 행은 NULL -> 첫 동기화 때 변경된 것으로 보고 전체 upsert)
+ALTER TABLE product ADD COLUMN IF NOT EXISTS content_hash bigint;
+COMMENT ON COLUMN product.content_hash IS '주요 필드 해시 (변경 감지용)';
+
+COMMIT;
+
+-- 4. 인덱스 생성
+CREATE INDEX IF NOT EXISTS ix_product_pid_updated
+ON product (pid, updated_dt);
+
+CREATE INDEX IF NOT EXISTS ix_category_provider_uid
+ON category (provider_uid);
+
+CREATE INDEX IF NOT EXISTS ix_file_product_uid
+ON file (product_uid);
@@ -6,7 +6,7 @@ class Category(Base):
     __tablename__ = "category"
 
     uid = Column(BigInteger, primary_key=True, autoincrement=True, comment="자동증가 기본키")
-    provider_uid = Column(BigInteger, ForeignKey("provider.uid", ondelete="SET NULL", onupdate="CASCADE"), comment="provider 테이블 FK")
+    provider_uid = Column(BigInteger, ForeignKey("provider.uid", ondelete="SET NULL", onupdate="CASCADE"), index=True, comment="provider 테이블 FK")
     title = Column(String(200), nullable=False, comment="카테고리명")
     id = Column(String(100), nullable=False, comment="카테고리 ID(코드)")
     depth = Column(SmallInteger, comment="카테고리 깊이")
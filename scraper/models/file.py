@@ -8,7 +8,7 @@ class File(Base):
     uid = Column(BigInteger, primary_key=True, autoincrement=True, comment="자동증가 기본키")
     provider_uid = Column(BigInteger, ForeignKey("provider.uid", ondelete="SET NULL", onupdate="CASCADE"), comment="provider 테이블 FK")
     category_uid = Column(BigInteger, ForeignKey("category.uid", ondelete="SET NULL", onupdate="CASCADE"), comment="category 테이블 FK")
-    product_uid = Column(BigInteger, ForeignKey("product.uid", ondelete="SET NULL", onupdate="CASCADE"), comment="product 테이블 FK")
+    product_uid = Column(BigInteger, ForeignKey("product.uid", ondelete="SET NULL", onupdate="CASCADE"), index=True, comment="product 테이블 FK")
     url = Column(Text, comment="파일(URL) 주소")
     path = Column(String(300), comment="서버 저장 경로(상대/절대)")
     count = Column(SmallInteger, default=0, comment="파일 수량")
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Boolean, String, Text, BigInteger, SmallInteger, Integer, TIMESTAMP, ForeignKey, Numeric, JSON
+from sqlalchemy import Column, Boolean, String, Text, BigInteger, SmallInteger, Integer, TIMESTAMP, ForeignKey, Numeric, JSON, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from core.database import Base
 
 class Product(Base):
     __tablename__ = "product"
+    __table_args__ = (
+        UniqueConstraint("provider_uid", "pid", name="uq_product_provider_pid"),
+        Index("ix_product_pid_updated", "pid", "updated_dt"),
+    )
 
     uid = Column(BigInteger, primary_key=True, autoincrement=True, comment="자동증가 기본키")
     provider_uid = Column(BigInteger, ForeignKey("provider.uid", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, comment="provider 테이블 FK")
@@ -21,6 +25,7 @@ class Product(Base):
     rmk = Column(JSON, comment="비고/추가정보(JSON)")
     desc = Column(Text, comment="비고/상세내용")
     is_conversion = Column(Boolean, comment="변환 여부")
+    content_hash = Column(BigInteger, comment="주요 필드 해시 (변경 감지용)")
     created_dt = Column(TIMESTAMP, server_default="CURRENT_TIMESTAMP", comment="생성일시")
     updated_dt = Column(TIMESTAMP, server_default="CURRENT_TIMESTAMP", comment="수정일시")
 
@@ -1,29 +1,58 @@
 from typing import Optional
+from datetime import datetime
+import asyncio
+import re
+import hashlib
 
-import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, and_
+from sqlalchemy import select, update, delete, insert, and_, or_, case, text, bindparam, String, TIMESTAMP
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from models import Provider, Product, Category, File
 
 from utils.string import parse_korean_number
 from utils.time import safe_parse_datetime, safe_parse_unix_timestamp
 
+from core.http import bunjang_client, response_json_async
 from core.logger import setup_logger
-from functools import wraps
-
-from datetime import datetime, timezone
 
 
 logger = setup_logger(__name__)  # 현재 파일명 기준 이름 지정
 
+PAGE_WINDOW = 5                           # 키워드당 한 번에 요청할 목록 페이지 수
+page_semaphore = asyncio.Semaphore(20)    # 전체 목록 페이지 동시 요청 수 제한
 
-async def fetch_categories(code: str, db: AsyncSession):
-    try:
+_DIGITS = re.compile(r"\d+")
+
+# provider 코드 -> (uid, code, url_api) 캐시
+_provider_cache: dict = {}
+
+# 판매 상태 코드 매핑 (그 외는 9:삭제)
+_SALE_STATUS = {
+    "SELLING": 1,
+    "RESERVED": 2,
+    "SOLD_OUT": 3
+}
+
+
+async def get_provider(code: str, db: AsyncSession):
+    # provider 정보는 거의 바뀌지 않으므로 코드별로 한 번만 조회해 메모리에 보관
+    provider = _provider_cache.get(code)
+    if provider is None:
+        # 필요한 컬럼만 조회 (ORM 객체 생성 없이 Row 사용)
         result = await db.execute(
-            select(Provider).where(Provider.code == code)
+            select(Provider.uid, Provider.code, Provider.url_api).where(Provider.code == code)
         )
-        provider = result.scalars().first()
+        provider = result.first()
+        if provider is not None:
+            _provider_cache[code] = provider
+    return provider
+
+
+async def fetch_categories(code: str, db: AsyncSession):
+    try:
+        provider = await get_provider(code, db)
         if not provider:
             raise ValueError(f"{code} provider 조회 실패")
 
@@ -37,36 +66,41 @@ async def fetch_categories(code: str, db: AsyncSession):
         return []
 
 
+def flatten_categories(raw_categories: list[dict], provider_uid: int) -> list[dict]:
+    # 재귀 대신 명시적 스택으로 전위 순회 (기존 재귀 버전과 같은 순서)
+    result = []
+    stack = [(cat, 1) for cat in reversed(raw_categories)]
+    while stack:
+        cat, depth = stack.pop()
+        result.append({
+            "provider_uid": provider_uid,
+            "id": str(cat["id"]),
+            "title": cat["title"],
+            "depth": depth,
+            "order": cat.get("order")
+        })
+        children = cat.get("categories")
+        if isinstance(children, list):
+            stack.extend((child, depth + 1) for child in reversed(children))
+    return result
+
+
 async def fetch_bunjang_categories(provider: Provider, db: AsyncSession):
     try:
         # 1. BUNJANG 분기 처리
         if provider.code == "BUNJANG":
             url = f"{provider.url_api.rstrip('/')}/1/categories/list.json"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                raw_categories = response.json().get("categories", [])
-
-            # 3. 전처리 (재귀 파싱)
-            def flatten(data, depth=1):
-                result = []
-                for cat in data:
-                    result.append(Category(
-                        provider_uid=provider.uid,
-                        id=str(cat["id"]),
-                        title=cat["title"],
-                        depth=depth,
-                        order=cat.get("order")
-                    ))
-                    if isinstance(cat.get("categories"), list):
-                        result += flatten(cat["categories"], depth + 1)
-                return result
-
-            parsed_categories = flatten(raw_categories)
-
-            # 4. 기존 데이터 삭제 후 저장
+            response = await bunjang_client.get(url)
+            response.raise_for_status()
+            raw_categories = (await response_json_async(response)).get("categories", [])
+
+            # 3. 전처리 (트리 평탄화, 순수 CPU 작업이라 워커 스레드에서 실행)
+            parsed_categories = await asyncio.to_thread(flatten_categories, raw_categories, provider.uid)
+
+            # 4. 기존 데이터 삭제 후 저장 (같은 트랜잭션에서 ORM 객체 없이 bulk INSERT)
             await db.execute(delete(Category).where(Category.provider_uid == provider.uid))
-            db.add_all(parsed_categories)
+            if parsed_categories:
+                await db.execute(insert(Category), parsed_categories)
             await db.commit()
             logger.info("카테고리 동기화 성공")
 
@@ -75,52 +109,126 @@ async def fetch_bunjang_categories(provider: Provider, db: AsyncSession):
         logger.exception("카테고리 동기화 실패")
 
 
-async def fetch_products(keyword: str, category: str, page: int = 0, accumulated: list[dict[str, str]] = None) -> list[dict[str, str]]:
-    if accumulated is None:
-        accumulated = []
+PAGE_SIZE = 100                           # 목록 페이지당 상품 수
 
-    try:
-        async with httpx.AsyncClient() as client:
-            res = await client.get(
-                "https://api.bunjang.co.kr/api/1/find_v2.json",
-                params={"f_category_id": category, "q": keyword, "page": page, "n": 100}
-            )
-            res.raise_for_status()
-            items = res.json().get("list", [])
 
-            # 종료 조건
-            if not items:
-                return accumulated
+async def fetch_page(keyword: str, category: str, page: int) -> tuple[list[dict], Optional[int]]:
+    """목록 한 페이지 조회 -> (상품 목록, 전체 상품 수(num_found, 없으면 None))"""
+    async with page_semaphore:
+        res = await bunjang_client.get(
+            "/api/1/find_v2.json",
+            params={"f_category_id": category, "q": keyword, "page": page, "n": PAGE_SIZE}
+        )
+    res.raise_for_status()
+    body = await response_json_async(res)
+    num_found = body.get("num_found")
+    return body.get("list", []), int(num_found) if str(num_found).isdigit() else None
 
-            for item in items:
-                pid = item.get("pid")
-                updated_dt = safe_parse_unix_timestamp(item.get("update_time"))  # or "updated_time", "updateDate" 등 실제 키에 맞게 수정
 
-                if pid and updated_dt:
-                    accumulated.append({
-                        "pid": str(pid),
-                        "updated_dt": str(updated_dt)
-                    })
+def collect_items(items: list[dict], accumulated: list[dict]):
+    # 수정일시는 여기서 한 번만 datetime으로 변환 (이후 비교 단계에서 다시 파싱하지 않음)
+    for item in items:
+        pid = item.get("pid")
+        updated_dt = safe_parse_unix_timestamp(item.get("update_time"))  # or "updated_time", "updateDate" 등 실제 키에 맞게 수정
 
-            print(f"fetch_products ==== keyword: {keyword}, category: {category}, page: {page}, 갯수: {len(accumulated)}")
+        if pid and updated_dt:
+            accumulated.append({
+                "pid": str(pid),
+                "updated_dt": updated_dt
+            })
 
-            # 다음 페이지 재귀 호출
-            return await fetch_products(keyword, category, page + 1, accumulated)
+
+async def fetch_products(keyword: str, category: str) -> tuple[list[dict], list[int]]:
+    """키워드 목록 전체 조회 -> (수집한 상품 목록, 조회에 실패한 페이지 번호 목록)"""
+    accumulated: list[dict] = []
+    failed_pages: list[int] = []
+    page = 0
+
+    try:
+        # 첫 페이지로 전체 상품 수를 확인
+        items, num_found = await fetch_page(keyword, category, page)
+        if not items:
+            return accumulated, failed_pages
+        collect_items(items, accumulated)
+        page += 1
+
+        # 첫 페이지가 덜 찼으면 마지막 페이지
+        if len(items) < PAGE_SIZE:
+            return accumulated, failed_pages
+
+        if num_found is not None:
+            # 전체 페이지 수를 알면 나머지 페이지를 한 번에 동시 요청 (전역 세마포어로 동시 요청 수 제한)
+            total_pages = max(-(-num_found // PAGE_SIZE), 1)
+            remaining = range(page, total_pages)
+            pages = await asyncio.gather(*(
+                fetch_page(keyword, category, p) for p in remaining
+            ), return_exceptions=True)
+            last_items = items
+            for p, result in zip(remaining, pages):
+                # 실패한 페이지는 건너뛰고 성공한 페이지 결과만 사용 (failed_pages로 불완전 결과임을 알림)
+                if isinstance(result, BaseException):
+                    logger.error("❌ %s 페이지 %s 에러 발생: %r", keyword, p, result)
+                    failed_pages.append(p)
+                    last_items = None
+                    continue
+                last_items = result[0]
+                collect_items(last_items, accumulated)
+            logger.info("fetch_products ==== keyword: %s, category: %s, 페이지: %s, 갯수: %s", keyword, category, total_pages, len(accumulated))
+
+            # 마지막 예상 페이지가 실패했거나 덜 찼으면 종료
+            if last_items is None or len(last_items) < PAGE_SIZE:
+                return accumulated, failed_pages
+            # 마지막 예상 페이지까지 가득 찼으면 num_found가 실제보다 작거나 상한이 걸린 것이므로 이어서 조회
+            logger.warning("[%s] ⚠️ num_found=%s 이후에도 상품이 있어 추가 페이지 조회", keyword, num_found)
+            page = total_pages
+
+        while True:
+            # PAGE_WINDOW 개 페이지씩 동시에 요청 (성공한 페이지 중 비었거나 덜 찬 페이지가 나오면 종료)
+            window = range(page, page + PAGE_WINDOW)
+            pages = await asyncio.gather(*(
+                fetch_page(keyword, category, p) for p in window
+            ), return_exceptions=True)
+
+            window_failed = 0
+            for p, result in zip(window, pages):
+                # 실패한 페이지는 결과 끝으로 취급하지 않고 기록만 한 뒤 다음 페이지 진행
+                if isinstance(result, BaseException):
+                    logger.error("❌ %s 페이지 %s 에러 발생: %r", keyword, p, result)
+                    failed_pages.append(p)
+                    window_failed += 1
+                    continue
+
+                items, _ = result
+                # 종료 조건
+                if not items:
+                    return accumulated, failed_pages
+
+                collect_items(items, accumulated)
+                logger.info("fetch_products ==== keyword: %s, category: %s, page: %s, 갯수: %s", keyword, category, p, len(accumulated))
+                if len(items) < PAGE_SIZE:
+                    return accumulated, failed_pages
+
+            # 윈도우 전체가 실패하면 끝을 알 수 없으므로 중단 (failed_pages로 불완전 결과임을 알림)
+            if window_failed == PAGE_WINDOW:
+                return accumulated, failed_pages
+            page += PAGE_WINDOW
     except Exception:
-        logger.exception(f"❌ {keyword} 페이지 {page} 에러 발생")
-        return accumulated
+        logger.exception("❌ %s 페이지 %s 에러 발생", keyword, page)
+        failed_pages.append(page)
+        return accumulated, failed_pages
 
 
 async def fetch_product_detail(pid: str, db: AsyncSession):
     try:
-        url = f"https://api.bunjang.co.kr/api/pms/v3/products-detail/{pid}?viewerUid=-1"
-        async with httpx.AsyncClient() as client:
-            res = await client.get(url)
-            if res.status_code != 200:
-                logger.warning(f"pid={pid} 상태코드={res.status_code} - 상품이 존재하지 않음(또는 비공개 등)")
-                await delete_product_by_pid(pid, db)
-                return None
-            return res.json().get("data", {}).get("product")
+        res = await bunjang_client.get(
+            f"/api/pms/v3/products-detail/{pid}",
+            params={"viewerUid": -1}
+        )
+        if res.status_code != 200:
+            logger.warning("pid=%s 상태코드=%s - 상품이 존재하지 않음(또는 비공개 등)", pid, res.status_code)
+            await delete_product_by_pid(pid, db)
+            return None
+        return (await response_json_async(res)).get("data", {}).get("product")
     except Exception as e:
         logger.exception("에러 발생")
         # 네트워크 등 예외 상황에서도 삭제 처리
@@ -128,103 +236,182 @@ async def fetch_product_detail(pid: str, db: AsyncSession):
         return None
 
 
-async def upsert_product(detail_data: dict, db: AsyncSession):
-    try:
+async def diff_products(src: dict[str, datetime], db: AsyncSession) -> tuple[list[str], list[str]]:
+    """수집한 {pid: 수정일시}를 임시 테이블에 올려 DB에서 비교 (신규/변경 pid, 삭제 대상 pid) 반환"""
+    await db.execute(text(
+        "CREATE TEMP TABLE tmp_src_product (pid varchar(60) PRIMARY KEY, updated_dt timestamp) ON COMMIT DROP"
+    ))
+    # 배열 파라미터 2개 + unnest로 한 번에 적재 (행 수만큼 바인드 파라미터가 늘지 않음)
+    await db.execute(
+        text(
+            "INSERT INTO tmp_src_product (pid, updated_dt) "
+            "SELECT * FROM unnest(:pids, :updated_dts)"
+        ).bindparams(
+            bindparam("pids", type_=ARRAY(String)),
+            bindparam("updated_dts", type_=ARRAY(TIMESTAMP))
+        ),
+        {"pids": list(src.keys()), "updated_dts": list(src.values())}
+    )
+
+    # 신규/변경: DB에 없거나(삭제 상태 포함) 수정일시가 다른 pid
+    result = await db.execute(text(
+        "SELECT t.pid FROM tmp_src_product t "
+        "LEFT JOIN product p ON p.pid = t.pid AND p.status <> 9 "
+        "WHERE p.uid IS NULL OR p.updated_dt IS DISTINCT FROM t.updated_dt"
+    ))
+    changed = result.scalars().all()
+
+    # 삭제 대상: 이번 수집 결과에 pid 자체가 없는 상품 (수정일시만 바뀐 상품은 제외)
+    result = await db.execute(text(
+        "SELECT p.pid FROM product p WHERE p.status <> 9 "
+        "AND NOT EXISTS (SELECT 1 FROM tmp_src_product t WHERE t.pid = p.pid)"
+    ))
+    removed = result.scalars().all()
+
+    await db.commit()
+    return changed, removed
+
+
+# ON CONFLICT 시 갱신할 컬럼 (uid, pid, provider_uid, created_dt, is_conversion 제외)
+_UPSERT_COLUMNS = (
+    "status", "title", "content", "price", "location", "brand",
+    "year", "odo", "category", "rmk", "content_hash", "updated_dt"
+)
+
+# 한 문장에 넣을 수 있는 바인드 파라미터 수 (asyncpg 한도 32767)
+MAX_BIND_PARAMS = 32767
+
+
+def build_product_row(detail_data: dict, provider_uid: int = 1) -> tuple[dict, str, int]:
+    """상세 응답 1건을 product row(dict)와 대표 이미지 정보로 변환"""
+    title = detail_data.get("name")
+    content = detail_data.get("description")
+    status = map_sale_status(detail_data.get("saleStatus"))
+    price = parse_korean_number(detail_data.get("price"))
+    location = detail_data.get("geo", {}).get("address", "")
+    category = detail_data.get("category", {}).get("name", "")
+    # color = detail_data["color"]
+    brand = detail_data.get("brand", {}).get("name", "")
+    year, odo = extract_year_and_odo(detail_data.get("options", []))
+    image_url = detail_data.get("imageUrl", "").replace("{res}", "1200")
+    image_count = detail_data.get("imageCount", 0)
+
+    row = {
+        "pid": str(detail_data["pid"]),
+        "provider_uid": provider_uid,
+        "status": status,
+        "title": title,
+        "content": content,
+        "price": price,
+        "location": location,
+        "brand": brand,
+        "year": year,
+        "odo": odo,
+        "category": category,
+        "rmk": detail_data,
+        "is_conversion": False,
+        "content_hash": compute_content_hash(
+            title, content, price, location, brand, year, odo, category, status, image_url
+        ),
+        "created_dt": safe_parse_datetime(detail_data.get("createdAt")),
+        "updated_dt": safe_parse_datetime(detail_data.get("updatedAt")),
+    }
+    return row, image_url, image_count
+
+
+async def _upsert_product_rows(rows: list[dict], db: AsyncSession) -> dict[str, int]:
+    """product row 묶음을 INSERT ... ON CONFLICT DO UPDATE 한 문장으로 실행하고, 실제로 반영된 {pid: uid} 반환"""
+    stmt = pg_insert(Product).values(rows)
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["provider_uid", "pid"],
+        set_={
+            **{column: excluded[column] for column in _UPSERT_COLUMNS},
+            # 내용 해시가 같으면 수정일시만 바뀐 것이므로 변환 여부(재임베딩 대상)는 유지
+            "is_conversion": case(
+                (and_(Product.content_hash == excluded.content_hash, Product.status != 9), Product.is_conversion),
+                else_=False
+            ),
+        },
+        # 수정일시가 그대로인 상품은 갱신하지 않음 (RETURNING에도 포함되지 않음, 삭제 상태였던 상품은 복구)
+        where=or_(Product.updated_dt.is_distinct_from(excluded.updated_dt), Product.status == 9)
+    ).returning(Product.uid, Product.pid)
+    return {pid: uid for uid, pid in (await db.execute(stmt)).all()}
+
+
+async def upsert_products(details: list[dict], db: AsyncSession):
+    """상품 상세 목록을 기존 상태 일괄 조회 후 INSERT ... ON CONFLICT DO UPDATE로 upsert (배치당 commit 1회)"""
+    provider_uid = 1
+
+    # 배치 내 기존 상품의 (uid, 수정일시, 내용 해시)를 한 번에 조회 (pid별 SELECT 제거)
+    # 삭제(status=9) 상태였던 상품은 다시 노출된 것이므로 전체 upsert 대상으로 둠
+    pids = list({str(detail_data["pid"]) for detail_data in details})
+    result = await db.execute(
+        select(Product.pid, Product.uid, Product.updated_dt, Product.content_hash)
+        .where(Product.provider_uid == provider_uid, Product.pid.in_(pids), Product.status != 9)
+    )
+    existing = {pid: (uid, updated_dt, content_hash) for pid, uid, updated_dt, content_hash in result.all()}
+
+    rows: dict[str, dict] = {}
+    images: dict[str, tuple[str, int]] = {}
+    touched: dict[int, dict] = {}
+    for detail_data in details:
         pid = str(detail_data["pid"])
-        provider_uid = 1
-
-        stmt = select(Product).where(and_(
-            Product.provider_uid == provider_uid,
-            Product.pid == pid
-        ))
-        result = await db.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        title = detail_data.get("name")
-        content = detail_data.get("description")
-        status = map_sale_status(detail_data.get("saleStatus"))
-        price = parse_korean_number(detail_data.get("price"))
-        location = detail_data.get("geo", {}).get("address", "")
-        category = detail_data.get("category", {}).get("name", "")
-        # color = detail_data["color"]
-        brand = detail_data.get("brand", {}).get("name", "")
-        year, odo = extract_year_and_odo(detail_data.get("options", []))
-        created_dt = safe_parse_datetime(detail_data.get("createdAt"))
-        updated_dt = safe_parse_datetime(detail_data.get("updatedAt"))
-        image_url = detail_data.get("imageUrl", "").replace("{res}", "1200")
-        image_count = detail_data.get("imageCount", 0)
-
-        if existing:
-            if existing.updated_dt != updated_dt:
-                # 필드 업데이트 (uid, pid 제외하고 모두 업데이트)
-                existing.title = title
-                existing.content = content
-                existing.price = price
-                existing.location = location
-                existing.updated_dt = updated_dt
-                existing.brand = brand
-                existing.year = year
-                existing.odo = odo
-                existing.category = category
-                existing.status = status
-                existing.rmk = detail_data
-                existing.is_conversion = False
-
-                # 기존 이미지 확인 및 교체
-                file_stmt = select(File).where(File.product_uid == existing.uid)
-                file_result = await db.execute(file_stmt)
-                existing_file = file_result.scalar_one_or_none()
-
-                if existing_file:
-                    if existing_file.url != image_url:
-                        await db.execute(delete(File).where(File.product_uid == existing.uid))
-                        db.add(File(
-                            product_uid=existing.uid,
-                            url=image_url,
-                            count=image_count
-                        ))
-                elif image_url:
-                    db.add(File(
-                        product_uid=existing.uid,
-                        url=image_url,
-                        count=image_count
-                    ))
-        else:
-            # 3. 새 Product 생성
-            product = Product(
-                pid=str(pid),
-                provider_uid=provider_uid,
-                status=status,
-                title=title,
-                content=content,
-                price=price,
-                location=location,
-                brand=brand,
-                year=year,
-                odo=odo,
-                category=category,
-                rmk=detail_data,
-                is_conversion=False,
-                created_dt=created_dt,
-                updated_dt=updated_dt
-            )
-            db.add(product)
-            await db.flush()  # ⚠️ product.uid 확보
-
-            # 4. 이미지 저장 (product.uid 사용)
-            if image_url:
-                db.add(File(
-                    product_uid=product.uid,  # 새로 생성된 product.uid
-                    url=image_url,
-                    count=image_count
-                ))
+        current = existing.get(pid)
+        # 변경 없는 상품은 나머지 필드 파싱 없이 건너뜀
+        if current and current[1] == safe_parse_datetime(detail_data.get("updatedAt")):
+            continue
+        try:
+            row, image_url, image_count = build_product_row(detail_data, provider_uid)
+        except Exception:
+            logger.exception("상품 상세 파싱 중 에러 발생 (pid=%s)", pid)
+            continue
+        if current and current[2] == row["content_hash"]:
+            # 내용은 그대로이고 수정일시만 바뀐 경우: 큰 text/json 컬럼 재기록 없이 updated_dt만 갱신
+            touched[current[0]] = {"uid": current[0], "updated_dt": row["updated_dt"]}
+            continue
+        # 같은 배치에 같은 pid가 두 번 오면 마지막 값만 사용 (한 문장에서 같은 행을 두 번 갱신할 수 없음)
+        rows[pid] = row
+        images[pid] = (image_url, image_count)
+
+    if touched:
+        await db.execute(update(Product), list(touched.values()))
+
+    if not rows:
         await db.commit()
-    except Exception:
-        logger.exception("상품 upsert 중 에러 발생")
+        return
 
-        await db.commit()
-    except Exception:
-        logger.exception("상품 upsert 중 에러 발생")
+    # asyncpg 바인드 파라미터 한도를 넘지 않도록 행 수를 나눠 여러 문장으로 실행 (commit은 마지막에 1회)
+    row_list = list(rows.values())
+    chunk_size = max(1, MAX_BIND_PARAMS // len(row_list[0]))
+    changed: dict[str, int] = {}
+    for i in range(0, len(row_list), chunk_size):
+        changed.update(await _upsert_product_rows(row_list[i:i + chunk_size], db))
+
+    # 이미지(File): 변경된 상품의 기존 파일을 한 번에 조회해 교체/추가 대상을 나눔
+    if changed:
+        result = await db.execute(
+            select(File.uid, File.product_uid, File.url)
+            .where(File.product_uid.in_(list(changed.values())))
+        )
+        existing_files = {product_uid: (uid, url) for uid, product_uid, url in result.all()}
+
+        file_updates, file_inserts = [], []
+        for pid, product_uid in changed.items():
+            image_url, image_count = images[pid]
+            existing_file = existing_files.get(product_uid)
+            if existing_file:
+                if existing_file[1] != image_url:
+                    file_updates.append({"uid": existing_file[0], "url": image_url, "count": image_count})
+            elif image_url:
+                file_inserts.append({"product_uid": product_uid, "url": image_url, "count": image_count})
+
+        if file_updates:
+            await db.execute(update(File), file_updates)
+        if file_inserts:
+            await db.execute(insert(File), file_inserts)
+
+    await db.commit()
 
 
 async def delete_product_by_pid(pid: str, db: AsyncSession):
@@ -237,10 +424,10 @@ async def delete_product_by_pid(pid: str, db: AsyncSession):
             product.status = 9  # 삭제 상태
             product.is_conversion = False
             await db.commit()
-            print(f"pid={pid} 상품 status=9(삭제)로 변경 완료")
+            logger.info("pid=%s 상품 status=9(삭제)로 변경 완료", pid)
             return True
         else:
-            print(f"pid={pid}에 해당하는 상품이 존재하지 않습니다.")
+            logger.info("pid=%s에 해당하는 상품이 존재하지 않습니다.", pid)
             return False
 
     except Exception as e:
@@ -249,7 +436,30 @@ async def delete_product_by_pid(pid: str, db: AsyncSession):
         return False
 
 
+async def mark_products_deleted(pids: list[str], db: AsyncSession, chunk_size: int = 1000) -> int:
+    """여러 pid를 한 번에 status=9(삭제)로 변경 (UPDATE ... WHERE pid = ANY, commit 1회)"""
+    deleted = 0
+    try:
+        for i in range(0, len(pids), chunk_size):
+            result = await db.execute(
+                update(Product)
+                .where(Product.pid.in_(pids[i:i + chunk_size]), Product.status != 9)
+                .values(status=9, is_conversion=False)
+                .execution_options(synchronize_session=False)
+            )
+            deleted += result.rowcount
+        await db.commit()
+        logger.info("상품 %s개 status=9(삭제)로 변경 완료", deleted)
+    except Exception:
+        logger.exception("mark_products_deleted 에러 발생")
+        await db.rollback()
+    return deleted
+
 
+def compute_content_hash(*fields) -> int:
+    # 변경 감지용 64비트 해시 (BIGINT 컬럼에 맞춰 signed 정수로 변환)
+    digest = hashlib.blake2b("\x1f".join(map(str, fields)).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
 
 def extract_year_and_odo(options: list[dict]) -> tuple[Optional[int], Optional[int]]:
     year = None
@@ -262,7 +472,7 @@ def extract_year_and_odo(options: list[dict]) -> tuple[Optional[int], Optional[i
         if group_id == "503" and value:
             # 연식: 숫자만 남기고 int로 변환
             try:
-                year = int("".join(filter(str.isdigit, value)))
+                year = int("".join(_DIGITS.findall(value)))
             except ValueError:
                 year = None
 
@@ -273,12 +483,11 @@ def extract_year_and_odo(options: list[dict]) -> tuple[Optional[int], Optional[i
             except Exception:
                 odo = None
 
+        # 연식/주행거리 모두 찾았으면 나머지 옵션은 볼 필요 없음
+        if year is not None and odo is not None:
+            break
+
     return year, odo
 
 def map_sale_status(sale_status: str) -> int:
-    mapping = {
-        "SELLING": 1,
-        "RESERVED": 2,
-        "SOLD_OUT": 3
-    }
-    return mapping.get(sale_status, 9)
+    return _SALE_STATUS.get(sale_status, 9)
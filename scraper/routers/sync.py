@@ -1,29 +1,29 @@
-from typing import Optional, Set
+from typing import Optional
 from pathlib import Path
-import httpx, asyncio
+import asyncio
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select, update, delete
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import JSONResponse
 
-from core.database import get_db, AsyncSessionLocal
-from models import Provider, Product
+from core.database import get_db, AsyncSessionLocal, engine, DB_PGBOUNCER
 from providers import bunjang
 from core.logger import setup_logger
-from providers.bunjang import fetch_products, fetch_product_detail, upsert_product, delete_product_by_pid
-from utils.string import parse_korean_number
-from utils.time import normalize_datetime, safe_parse_datetime
+from providers.bunjang import fetch_products, fetch_product_detail, upsert_products, mark_products_deleted
 
 logger = setup_logger(__name__)  # 현재 파일명 기준 이름 지정
 
 router = APIRouter(prefix="/sync", tags=["Sync"])
 
-keyword_queue: list[str] = []         # 아직 처리하지 않은 키워드
+keyword_queue: asyncio.Queue[str] = asyncio.Queue()  # 아직 처리하지 않은 키워드
 total_keywords: int = 0               # 전체 키워드 수
 batch_size: int = 5
+detail_concurrency: int = 20          # 상세 조회 동시 요청 수
+upsert_batch_size: int = 500          # 상세 upsert commit 단위
 processed_count: int = 0             # 현재까지 처리된 수
-is_running: bool = False             # 실행 중 여부
+# 상품 동기화 중복 실행 방지용 advisory lock 키 (여러 워커/인스턴스 간 공유, 커넥션 종료 시 자동 해제)
+SYNC_LOCK_KEY: int = 0x42554E4A      # "BUNJ"
 pid_lock = asyncio.Lock()             # 동시성 제어를 위한 lock
 
 
@@ -43,114 +43,157 @@ async def sync_products(
     category: Optional[str] = Query("750800", description="카테고리"),
     db: AsyncSession = Depends(get_db)
 ):
-    global keyword_queue, total_keywords, processed_count, is_running
-    all_product_pids: list[dict[str, str]] = []    # pid 중복 제거용 list
-
-    if is_running:
+    global keyword_queue, total_keywords, processed_count
+    all_product_pids: list[dict] = []    # 수집한 {pid, updated_dt(datetime)} 목록
+
+    # 동기화 동안 전용 커넥션(autocommit)을 잡아두고 session 단위 advisory lock 획득 (다른 프로세스에서 실행 중이면 실패)
+    # 트랜잭션을 열어두지 않으므로 idle_in_transaction_session_timeout에 걸리지 않고, 커넥션이 끊기면 lock도 해제됨
+    if DB_PGBOUNCER:
+        logger.warning("⚠️ DB_PGBOUNCER 설정 시 session 단위 advisory lock이 유지되려면 PgBouncer session 모드가 필요합니다")
+    lock_conn = await engine.connect()
+    try:
+        await lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+        acquired = (await lock_conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": SYNC_LOCK_KEY}
+        )).scalar()
+    except Exception:
+        await lock_conn.close()
+        raise
+
+    if not acquired:
+        await lock_conn.close()
         return JSONResponse(
             status_code=409,
-            content={
-                "message": "이미 실행 중입니다.",
-                "progress": f"{processed_count}/{total_keywords}"
-            }
+            content={"message": "이미 실행 중입니다."}
         )
 
-    result = await db.execute(select(Provider).where(Provider.code == code))
-    provider = result.scalars().first()
-
-    # 키워드 로딩
-    text = Path("./list.txt").read_text(encoding="utf-8")
-    keywords = []
-    for line in text.splitlines():
-        for item in line.split(","):
-            kw = item.strip()
-            if kw and kw not in keywords:
-                keywords.append(kw)
-
-    keyword_queue = keywords
-    total_keywords = len(keyword_queue)
+    async def release_lock():
+        try:
+            await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": SYNC_LOCK_KEY})
+        except Exception:
+            # 해제에 실패한 커넥션은 풀로 돌려보내지 않고 폐기 (커넥션 종료 시 lock도 해제됨)
+            logger.exception("❌ advisory lock 해제 실패")
+            await lock_conn.invalidate()
+        finally:
+            await lock_conn.close()
+
+    try:
+        provider = await bunjang.get_provider(code, db)
+
+        # 키워드 로딩
+        keyword_text = Path("./list.txt").read_text(encoding="utf-8")
+    except BaseException:
+        # 백그라운드 작업을 시작하지 못하면 여기서 lock 해제
+        await release_lock()
+        raise
+
+    # dict.fromkeys로 입력 순서를 유지하면서 한 번의 순회로 중복 제거
+    keywords = dict.fromkeys(
+        kw for line in keyword_text.splitlines() for item in line.split(",") if (kw := item.strip())
+    )
+
+    keyword_queue = asyncio.Queue()
+    for kw in keywords:
+        keyword_queue.put_nowait(kw)
+    total_keywords = keyword_queue.qsize()
     processed_count = 0
     all_product_pids.clear()
 
-    async def sync_detail_and_save(pid: str):
-        async with AsyncSessionLocal() as db:
-            detail = await fetch_product_detail(pid, db)
-            if detail:
-                await upsert_product(detail, db)
+    async def sync_details_and_save(pids: list[str]):
+        # 상세 조회는 세마포어 한도 내에서 동시에 진행하고, 조회된 결과는 큐를 통해 배치 단위로 저장
+        semaphore = asyncio.Semaphore(detail_concurrency)
+        detail_queue: asyncio.Queue = asyncio.Queue(maxsize=upsert_batch_size * 2)
 
-    async def sync_update_deleted(pid: str):
-        async with AsyncSessionLocal() as db:
-            await delete_product_by_pid(pid, db)
+        async def fetch_detail(pid: str):
+            async with semaphore:
+                async with AsyncSessionLocal() as db:
+                    detail = await fetch_product_detail(pid, db)
+            if detail:
+                await detail_queue.put(detail)
+
+        async def save_batch(details: list[dict]):
+            try:
+                async with AsyncSessionLocal() as db:
+                    await upsert_products(details, db)
+            except Exception:
+                logger.exception("❌ 상세 upsert 배치 저장 실패 (%s개)", len(details))
+
+        async def save_details():
+            batch = []
+            while (detail := await detail_queue.get()) is not None:
+                batch.append(detail)
+                if len(batch) >= upsert_batch_size:
+                    await save_batch(batch)
+                    batch = []
+            if batch:
+                await save_batch(batch)
+
+        saver = asyncio.create_task(save_details())
+        try:
+            await asyncio.gather(*(fetch_detail(pid) for pid in pids))
+        finally:
+            await detail_queue.put(None)
+            await saver
 
     async def run_keyword_sync():
-        global is_running, processed_count
+        global processed_count
         nonlocal all_product_pids
-        is_running = True
         try:
             logger.info("🚀 키워드 동기화 시작")
 
-            # 1. pid 수집
+            # 1. pid 수집 (목록 조회가 일부라도 실패한 키워드는 incomplete_keywords에 기록)
+            incomplete_keywords: list[str] = []
+
             async def worker(worker_id: int):
-                global keyword_queue, processed_count
+                global processed_count
                 while True:
                     try:
-                        keyword = keyword_queue.pop(0)
-                    except IndexError:
+                        keyword = keyword_queue.get_nowait()
+                    except asyncio.QueueEmpty:
                         break
                     try:
                         if not provider or provider.code == "BUNJANG":
-                            all_product_pids.extend(await fetch_products(keyword=keyword, category=category))
+                            items, failed_pages = await fetch_products(keyword=keyword, category=category)
+                            all_product_pids.extend(items)
+                            if failed_pages:
+                                logger.warning("[%s] ⚠️ 조회 실패 페이지: %s", keyword, failed_pages)
+                                incomplete_keywords.append(keyword)
                             processed_count += 1
                     except Exception:
-                        logger.exception(f"[{keyword}] ❌ 작업자 {worker_id} 에러 발생")
+                        logger.exception("[%s] ❌ 작업자 %s 에러 발생", keyword, worker_id)
+                        incomplete_keywords.append(keyword)
 
             tasks = [asyncio.create_task(worker(i)) for i in range(batch_size)]
             await asyncio.gather(*tasks)
 
-            # 1. DB 조회
+            # 1. DB 비교 (수집 결과를 임시 테이블에 올려 DB에서 차집합 계산, 상품 테이블 전체를 가져오지 않음)
+            # 여러 키워드에서 같은 pid가 나오면 마지막 값 사용
+            src = {item["pid"]: item["updated_dt"] for item in all_product_pids}
             async with AsyncSessionLocal() as new_db:
-                dbProducts = select(Product).where(Product.status != 9)
-                dbResult = await new_db.execute(dbProducts)
-                dbProductsList = dbResult.scalars().all()
-                dbList = [{"pid": p.pid, "updated_dt": p.updated_dt} for p in dbProductsList]
+                only_src, only_db = await bunjang.diff_products(src, new_db)
 
-            # safe_parse_datetime 등으로 날짜를 비교 가능한 형태로 통일해야 함
-            src_set = set((item["pid"], safe_parse_datetime(item["updated_dt"])) for item in all_product_pids)
-            db_set = set((item["pid"], normalize_datetime(item["updated_dt"])) for item in dbList)
+            logger.info("✅ 신규/업데이트 대상: %s개, 삭제 대상: %s개", len(only_src), len(only_db))
 
-            # 1. 신규/업데이트 대상 (all_product_pids에만 있음)
-            only_src = src_set - db_set
-            # 2. 삭제 대상 (DB에만 있음)
-            only_db = db_set - src_set
+            # 2. 상세 정보 upsert
+            await sync_details_and_save(only_src)
 
-            logger.info(f"✅ 신규/업데이트 대상: {len(only_src)}개, 삭제 대상: {len(only_db)}개")
+            # 3. 삭제 처리는 pid 목록 단위 UPDATE로 한 번에 실행
+            # 수집 결과가 비었거나 일부 키워드 조회가 실패했으면 누락된 상품을 삭제로 오판할 수 있으므로 건너뜀
+            if not src or incomplete_keywords:
+                logger.warning(
+                    "⚠️ 수집 결과가 불완전하여 삭제 처리 생략 (수집 %s개, 실패 키워드 %s개)",
+                    len(src), len(incomplete_keywords)
+                )
+            elif only_db:
+                async with AsyncSessionLocal() as db:
+                    await mark_products_deleted(only_db, db)
 
-            # 2. 상세 정보 upsert
-            srcs = list(only_src)
-            src_chunks = [srcs[i:i+batch_size] for i in range(0, len(srcs), batch_size)]
-            for chunk in src_chunks:
-                detail_tasks = [
-                    asyncio.create_task(sync_detail_and_save(pid))
-                    for pid, updated_dt in chunk
-                ]
-                await asyncio.gather(*detail_tasks)
-
-            # 3. 삭제 처리도 batch로 실행
-            dbs = list(only_db)
-            db_chunks = [dbs[i:i+batch_size] for i in range(0, len(dbs), batch_size)]
-            for chunk in db_chunks:
-                delete_tasks = [
-                    asyncio.create_task(sync_update_deleted(pid))
-                    for pid, updated_dt in chunk
-                ]
-                await asyncio.gather(*delete_tasks)
-
-            logger.info("✅ 상세 upsert 완료.")
+            logger.info("✅ 상세 upsert 완료. (키워드 %s/%s)", processed_count, total_keywords)
 
         except Exception:
             logger.exception("❌ run_keyword_sync 에러 발생")
         finally:
-            is_running = False
+            await release_lock()
 
     asyncio.create_task(run_keyword_sync())
     #logger.info(f"total_keywords: {total_keywords}, keyword_queue: {keyword_queue}")
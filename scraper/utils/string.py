@@ -1,8 +1,14 @@
 import re
+from functools import lru_cache
 
+_NON_NUMBER = re.compile(r'[^0-9억만천백십]')
+_SMALL_UNIT = re.compile(r'(\d+)?(천|백|십)')
+
+# 가격/주행거리 문자열은 반복되는 값이 많으므로 결과를 캐시
+@lru_cache(maxsize=4096)
 def parse_korean_number(text: str) -> int:
     def clean_input(text):
-        return re.sub(r'[^0-9억만천백십]', '', str(text))
+        return _NON_NUMBER.sub('', str(text))
 
     def promote_to_higher_unit(values: list, higher_unit: list):
         last_increase_idx = -1
@@ -15,12 +21,12 @@ def parse_korean_number(text: str) -> int:
 
     def parse_small_units(text):
         unit_map = {'천': 1000, '백': 100, '십': 10}
-        parts = re.findall(r'(\d+)?(천|백|십)', text)
+        parts = _SMALL_UNIT.findall(text)
         result = []
         for num, unit in parts:
             value = int(num) if num else 1
             result.append(value * unit_map[unit])
-        text = re.sub(r'(\d+)?(천|백|십)', '', text)
+        text = _SMALL_UNIT.sub('', text)
         if text.isdigit():
             result.append(int(text))
         return result
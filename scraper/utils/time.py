@@ -1,5 +1,8 @@
 from datetime import datetime, timezone
+from functools import lru_cache
 
+# 같은 수정일시 문자열이 키워드/페이지마다 반복되므로 파싱 결과를 캐시 (datetime은 불변이라 공유해도 안전)
+@lru_cache(maxsize=65536)
 def safe_parse_datetime(dt_str):
     if not dt_str:
         return None
@@ -7,6 +10,7 @@ def safe_parse_datetime(dt_str):
     dt = dt.replace(microsecond=0, tzinfo=None)  # 마이크로초 제거 + tz 제거
     return dt
 
+@lru_cache(maxsize=65536)
 def safe_parse_unix_timestamp(dt_value):
     if not dt_value:
         return None
@@ -12,6 +12,9 @@ POSTGRES_DB = os.getenv("POSTGRES_DB")
 POSTGRES_HOST = os.getenv("POSTGRES_HOST")
 POSTGRES_PORT = os.getenv("POSTGRES_PORT")
 
+# SQL 로그는 디버깅 시에만 (매 쿼리마다 로그 포맷팅 비용 발생)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+
 DATABASE_URL = (
     f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}"
     f"@{POSTGRES_HOST}/{POSTGRES_DB}"
@@ -20,7 +23,7 @@ DATABASE_URL = (
 
 engine = create_async_engine(
     DATABASE_URL, 
-    echo=True,
+    echo=DB_ECHO,
     pool_recycle=180,        # 180초마다 커넥션 재사용 방지
     pool_pre_ping=True       # 커넥션 살아있는지 ping 확인
 )